@@ -8,18 +8,24 @@
 При деплое убедитесь, что файл .env НЕ попадает в систему контроля версий, добавив его в .gitignore.
 """
 
+import json  # Для разбора CORS-доменов, заданных JSON-списком
 import secrets  # Для генерации случайных значений (секретные ключи)
 import warnings  # Для вывода предупреждений
 
+from functools import (
+    cached_property,  # Для кэширования вычисляемых полей
+    lru_cache,  # Для ленивого создания единственного объекта настроек
+)
+
+from collections.abc import Mapping
 from typing import Annotated, Any, Literal  # Импортируем аннотации типов
 from pydantic import (
     AnyUrl,  # Валидатор для URL
     BeforeValidator,  # Декоратор для предварительной обработки
-    PostgresDsn,  # Валидатор для строки подключения к PostgreSQL
+    Field,  # Описание поля (для default_factory)
     computed_field,  # Декоратор для вычисляемых полей
     model_validator,  # Декоратор для дополнительной проверки модели
 )
-from pydantic_core import MultiHostUrl  # Для построения сложных URL
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
@@ -29,20 +35,39 @@ from typing_extensions import (
 )  # Для аннотации возвращаемого типа self при валидации
 
 
-def parse_cors(v: Any) -> list[str] | str:
+# Подозрительные значения по умолчанию для секретных переменных
+_UNSAFE_DEFAULTS: dict[str, frozenset[str]] = {
+    "SECRET_KEY": frozenset({"ваш_уникальный_секретный_ключ", "changeme", "secret"}),
+    "POSTGRES_PASSWORD": frozenset({"postgres", "password", "123456"}),
+    "FIRST_SUPERUSER_PASSWORD": frozenset({"admin", "admin123", "qwerty", "123456"}),
+}
+
+
+def _generate_secret() -> str:
+    """Генерирует случайный секрет для полей, не заданных в .env."""
+    return secrets.token_urlsafe(32)
+
+
+def parse_cors(v: Any) -> list[str]:
     """
-    Преобразует строку с адресами, разделёнными запятыми, в список доменов.
+    Преобразует строку с адресами, разделёнными запятыми, или JSON-список в список доменов.
 
     Аргументы:
         v: Значение CORS из файла .env (строка или список).
 
     Возвращает:
-        Список доменов для разрешённых CORS.
+        Список доменов для разрешённых CORS; дальше pydantic проверяет каждый как AnyUrl.
     """
-    if isinstance(v, str) and not v.startswith("["):
-        return [i.strip() for i in v.split(",")]
-    elif isinstance(v, list | str):
+    if isinstance(v, list):
         return v
+    if isinstance(v, str):
+        if v.startswith("["):
+            origins = json.loads(v)
+            if not isinstance(origins, list):
+                raise ValueError("Некорректный формат CORS")
+            return origins
+        # Один проход split, пустые элементы отбрасываются
+        return [s for s in (t.strip() for t in v.split(",")) if s]
     raise ValueError("Некорректный формат CORS")
 
 
@@ -60,12 +85,33 @@ class Settings(BaseSettings):
         env_file=".env",
         env_ignore_empty=True,  # Игнорировать пустые значения
         extra="ignore",  # Игнорировать переменные, не описанные в модели
+        defer_build=True,  # Строить валидаторы при первой валидации, а не при импорте
+        validate_default=False,  # Не перепроверять значения по умолчанию
+        # Настройки неизменяемы после создания: присваивание не проверяется,
+        # а кэш вычисляемых полей в __dict__ не сбрасывается
+        frozen=True,
+        validate_assignment=False,
     )
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """
+        Копирует настройки и сбрасывает кэш вычисляемых полей.
+
+        Значения cached_property хранятся в __dict__ и копируются вместе с ним,
+        поэтому без сброса model_copy(update=...) вернул бы устаревшие
+        database_url, server_host и т.д.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        for name in type(self).model_computed_fields:
+            copy.__dict__.pop(name, None)
+        return copy
+
     # --- Основные настройки API и проекта ---
     API_V1_STR: str = "/api/v1"  # Версия API
     # Если SECRET_KEY указан в .env, он перезапишет эту автогенерацию
-    SECRET_KEY: str = secrets.token_urlsafe(32)
+    SECRET_KEY: str = Field(default_factory=_generate_secret)
     REDIS_HOST: str = "localhost"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # Срок жизни токена: 8 дней
 
@@ -79,7 +125,7 @@ class Settings(BaseSettings):
     CHROME_DRIVER: str = "local"
 
     @computed_field
-    @property
+    @cached_property
     def server_host(self) -> str:
         """
         Вычисляемое поле для формирования URL сервера.
@@ -96,6 +142,16 @@ class Settings(BaseSettings):
         []
     )
 
+    @computed_field
+    @cached_property
+    def cors_origins_set(self) -> frozenset[str]:
+        """
+        Множество разрешённых CORS-доменов без завершающего слэша.
+
+        Вычисляется один раз при первом обращении; домены уже проверены как AnyUrl.
+        """
+        return frozenset(str(o).rstrip("/") for o in self.BACKEND_CORS_ORIGINS)
+
     # --- Параметры проекта ---
     PROJECT_NAME: str  # Название проекта, задается через .env
     SENTRY_DSN: AnyUrl | None = None  # DSN для Sentry, если используется
@@ -110,14 +166,18 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432  # Порт подключения к БД
 
     @computed_field
-    @property
-    def database_url(self) -> PostgresDsn:
+    @cached_property
+    def database_url(self) -> str:
         """
         Вычисляемое поле для формирования строки подключения к PostgreSQL.
 
         Используется схема подключения postgresql+asyncpg.
+        Возвращается обычная строка: движку не нужен объект PostgresDsn.
         """
-        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
 
     # --- Настройки отправки email ---
     SMTP_HOST: str | None = None  # SMTP-сервер (например, smtp.gmail.com)
@@ -127,20 +187,10 @@ class Settings(BaseSettings):
     EMAILS_FROM_EMAIL: str | None = None  # Email, с которого отправляются письма
     EMAILS_FROM_NAME: str | None = None  # Имя отправителя для писем
 
-    @model_validator(mode="after")
-    def _set_default_emails_from(self) -> Self:
-        """
-        Устанавливает имя отправителя по умолчанию, если оно не задано в .env.
-        В данном проекте имя отправителя по умолчанию равно названию проекта.
-        """
-        if not self.EMAILS_FROM_NAME:
-            self.EMAILS_FROM_NAME = self.PROJECT_NAME
-        return self
-
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48  # Время жизни токена для сброса пароля
 
     @computed_field
-    @property
+    @cached_property
     def emails_enabled(self) -> bool:
         """
         Проверяет, можно ли отправлять email: активна функция, если заданы SMTP_HOST и EMAILS_FROM_EMAIL.
@@ -159,22 +209,17 @@ class Settings(BaseSettings):
     )
 
     # --- Дополнительные секреты ---
-    RESET_PASSWORD_TOKEN_SECRET: str = secrets.token_urlsafe(32)
-    VERIFICATION_TOKEN_SECRET: str = secrets.token_urlsafe(32)
+    # Генерируются только если не заданы в .env
+    RESET_PASSWORD_TOKEN_SECRET: str = Field(default_factory=_generate_secret)
+    VERIFICATION_TOKEN_SECRET: str = Field(default_factory=_generate_secret)
 
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         """
         Проверяет, не используется ли небезопасное значение по умолчанию
         для заданной переменной (var_name).
         """
-        # Словарь подозрительных значений по умолчанию
-        unsafe_defaults = {
-            "SECRET_KEY": ["ваш_уникальный_секретный_ключ", "changeme", "secret"],
-            "POSTGRES_PASSWORD": ["postgres", "password", "123456"],
-            "FIRST_SUPERUSER_PASSWORD": ["admin", "admin123", "qwerty", "123456"],
-        }
-
-        if var_name in unsafe_defaults and value in unsafe_defaults[var_name]:
+        bad = _UNSAFE_DEFAULTS.get(var_name)
+        if bad and value in bad:
             message = (
                 f"Значение переменной {var_name} установлено как небезопасное по умолчанию: '{value}'.\n"
                 f"Пожалуйста, задайте надёжное значение в .env перед запуском в {self.ENVIRONMENT}-окружении."
@@ -184,8 +229,23 @@ class Settings(BaseSettings):
             else:
                 raise ValueError(message)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _set_default_emails_from(cls, data: Any) -> Any:
+        """
+        Устанавливает имя отправителя по умолчанию, если оно не задано в .env.
+        В данном проекте имя отправителя по умолчанию равно названию проекта.
+        Значение подставляется до создания модели, поэтому замороженная модель
+        не изменяется, а поле попадает в model_fields_set.
+        """
+        if isinstance(data, dict) and not data.get("EMAILS_FROM_NAME"):
+            project_name = data.get("PROJECT_NAME")
+            if project_name:
+                data = {**data, "EMAILS_FROM_NAME": project_name}
+        return data
+
     @model_validator(mode="after")
-    def _enforce_non_default_secrets(self) -> Self:
+    def _post_init(self) -> Self:
         """
         Проверяет, что важные секретные параметры не используют значения по умолчанию.
         Это необходимо для обеспечения безопасности вашего блога.
@@ -198,8 +258,25 @@ class Settings(BaseSettings):
         return self
 
 
-# Создание глобального объекта настроек, который можно импортировать во всём проекте.
-settings = Settings()  # type: ignore
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Возвращает единственный объект настроек проекта.
+
+    Настройки создаются при первом вызове, а не при импорте модуля,
+    поэтому импорт app.core.config ничего не стоит.
+    """
+    return Settings()  # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Сохраняет совместимость с `from app.core.config import settings`:
+    атрибут settings создаётся лениво через get_settings().
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Рекомендация для разработчика:
 # 1. При локальной разработке используйте .env с ENVIRONMENT=local.
@@ -208,4 +285,4 @@ settings = Settings()  # type: ignore
 # 4. При добавлении новых настроек:
 #    - добавьте переменную в .env,
 #    - объявите соответствующее поле в классе Settings, и
-#    - используйте новые значения через объект settings.
+#    - используйте новые значения через get_settings() (или объект settings).
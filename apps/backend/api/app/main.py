@@ -1,14 +1,55 @@
 # myblog/apps/backend/api/app/main.py
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp
 
-app = FastAPI()
+from app.core.config import get_settings
 
+# Uvicorn настраивает только свои логгеры, поэтому пишем через uvicorn.error:
+# иначе INFO-сообщения не попадут в вывод сервера
+logger = logging.getLogger("uvicorn.error")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Жизненный цикл приложения: настройки загружаются при старте сервера,
+    а не при импорте модуля.
+    """
+    settings = get_settings()
+    logger.info("Запуск приложения %s", settings.PROJECT_NAME)
+    yield
 
-@app.get("/")
-def read_root():
-    return {"message": "Привет, мир! Сайт работает ✅"}
 
+def cors_middleware(app: ASGIApp) -> ASGIApp:
+    """
+    Подключает CORSMiddleware с доменами из настроек.
 
-from app.core.config import settings
+    Starlette вызывает эту фабрику при сборке стека middleware (на старте сервера),
+    поэтому настройки по-прежнему не читаются при импорте модуля.
+    """
+    origins = get_settings().cors_origins_set
+    if not origins:
+        return app
+    return CORSMiddleware(
+        app,
+        allow_origins=sorted(origins),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
-print(settings.PROJECT_NAME)
+
+# Ответы сериализуются через orjson вместо стандартного json
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(cors_middleware)
+
+
+@app.get("/")
+def read_root():
+    return {"message": "Привет, мир! Сайт работает ✅"}
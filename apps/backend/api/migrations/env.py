@@ -1,5 +1,4 @@
 import asyncio  # Для запуска асинхронных функций
-import os  # Для чтения переменных окружения
 from logging.config import fileConfig  # Для настройки логирования из файла alembic.ini
 
 from sqlalchemy import pool  # Для управления пулом соединений
@@ -27,16 +26,12 @@ target_metadata = BaseModel.metadata  # Целевая "схема" БД для
 
 def get_url() -> str:
     """
-    Собираем строку подключения к базе данных из .env.
-    Если переменные не заданы, берём "postgres" и "localhost" по умолчанию.
+    Собираем строку подключения к базе данных из настроек проекта (.env).
     """
-    user = os.getenv("POSTGRES_USER", "postgres")
-    password = os.getenv("POSTGRES_PASSWORD", "postgres")
-    server = os.getenv("POSTGRES_SERVER", "localhost")
-    port = os.getenv("POSTGRES_PORT", "5432")
-    db = os.getenv("POSTGRES_DB", "postgres")
+    from app.core.config import get_settings
+
     # Формируем URL по шаблону asyncpg для асинхронного подключения
-    return f"postgresql+asyncpg://{user}:{password}@{server}:{port}/{db}?async_fallback=True"
+    return f"{get_settings().database_url}?async_fallback=True"
 
 
 # Подставляем нашу строку подключения вместо статичной в alembic.ini
@@ -94,8 +89,16 @@ async def run_async_migrations() -> None:
 def run_migrations_online() -> None:
     """
     Обёртка для запуска асинхронных миграций в синхронном контексте.
+    Если установлен uvloop (>= 0.18), используем его цикл событий вместо стандартного.
     """
-    asyncio.run(run_async_migrations())
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    # uvloop.run появился только в uvloop 0.18, старые версии запускаем через asyncio
+    run = getattr(uvloop, "run", asyncio.run)
+    run(run_async_migrations())
 
 
 # В зависимости от режима (offline/online) вызываем соответствующую функцию
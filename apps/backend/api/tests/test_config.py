@@ -0,0 +1,40 @@
+import pytest
+
+from app.core.config import Settings
+from tests.utils import make_settings
+
+
+def test_model_copy_resets_computed_fields() -> None:
+    settings = make_settings()
+    assert settings.database_url.endswith("/blog_db")
+    assert settings.server_host == "http://localhost"
+
+    copy = settings.model_copy(update={"POSTGRES_DB": "other", "DOMAIN": "example.com"})
+    assert copy.database_url.endswith("/other")
+    assert copy.server_host == "http://example.com"
+    # Исходный объект сохраняет свои значения
+    assert settings.database_url.endswith("/blog_db")
+
+
+def test_emails_from_name_defaults_to_project_name() -> None:
+    settings = make_settings()
+    assert settings.EMAILS_FROM_NAME == "test"
+    assert "EMAILS_FROM_NAME" in settings.model_fields_set
+
+
+def test_emails_from_name_keeps_explicit_value() -> None:
+    settings = make_settings(EMAILS_FROM_NAME="Блог")
+    assert settings.EMAILS_FROM_NAME == "Блог"
+
+
+def test_emails_from_name_default_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PROJECT_NAME", "env-project")
+    settings = Settings(
+        _env_file=None,  # type: ignore[call-arg]
+        POSTGRES_SERVER="localhost",
+        POSTGRES_USER="user",
+        POSTGRES_PASSWORD="s3cure-pass",
+        FIRST_SUPERUSER="admin@example.com",
+        FIRST_SUPERUSER_PASSWORD="s3cure-pass",
+    )
+    assert settings.EMAILS_FROM_NAME == "env-project"
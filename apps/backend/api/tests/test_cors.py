@@ -0,0 +1,113 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+import app.main as main
+from app.core.config import parse_cors
+from tests.utils import make_settings
+
+
+def test_parse_cors_comma_separated() -> None:
+    assert parse_cors("http://a.com, http://b.com") == ["http://a.com", "http://b.com"]
+
+
+def test_parse_cors_drops_empty_items() -> None:
+    assert parse_cors("http://a.com,, ,http://b.com,") == [
+        "http://a.com",
+        "http://b.com",
+    ]
+
+
+def test_parse_cors_decodes_json_and_keeps_lists() -> None:
+    assert parse_cors('["http://a.com"]') == ["http://a.com"]
+    assert parse_cors(["http://a.com"]) == ["http://a.com"]
+
+
+@pytest.mark.parametrize("raw", [42, '["http://a.com"', '[1] "x"'])
+def test_parse_cors_rejects_invalid_values(raw: Any) -> None:
+    with pytest.raises(ValueError):
+        parse_cors(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "http://a.com, http://b.com/",
+        '["http://a.com", "http://b.com/"]',
+        ["http://a.com/", "http://b.com"],
+        "http://a.com,,http://b.com, ",
+    ],
+)
+def test_cors_origins_set(raw: Any) -> None:
+    settings = make_settings(BACKEND_CORS_ORIGINS=raw)
+    assert settings.cors_origins_set == frozenset({"http://a.com", "http://b.com"})
+
+
+def test_cors_origins_set_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", '["http://a.com/"]')
+    assert make_settings().cors_origins_set == frozenset({"http://a.com"})
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["http://A.com/", '["http://A.com"]', ["http://A.com"]],
+)
+def test_cors_origins_set_normalizes_host(raw: Any) -> None:
+    settings = make_settings(BACKEND_CORS_ORIGINS=raw)
+    assert settings.cors_origins_set == frozenset({"http://a.com"})
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ['["not a url", "http://a.com"]', '["http://a.com"', "not a url"],
+)
+def test_cors_origins_rejects_invalid_input(raw: str) -> None:
+    with pytest.raises(ValidationError):
+        make_settings(BACKEND_CORS_ORIGINS=raw)
+
+
+def test_cors_origins_set_empty() -> None:
+    assert make_settings().cors_origins_set == frozenset()
+
+
+def make_client(monkeypatch: pytest.MonkeyPatch, origins: str) -> TestClient:
+    settings = make_settings(BACKEND_CORS_ORIGINS=origins)
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    app = FastAPI()
+    app.add_middleware(main.cors_middleware)
+
+    @app.get("/")
+    def read_root() -> dict[str, str]:
+        return {}
+
+    return TestClient(app)
+
+
+def preflight(client: TestClient, origin: str) -> Any:
+    return client.options(
+        "/",
+        headers={"Origin": origin, "Access-Control-Request-Method": "GET"},
+    )
+
+
+def test_cors_middleware_preflight(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = make_client(monkeypatch, "http://a.com/, http://b.com")
+
+    allowed = preflight(client, "http://a.com")
+    assert allowed.status_code == 200
+    assert allowed.headers["access-control-allow-origin"] == "http://a.com"
+
+    denied = preflight(client, "http://evil.com")
+    assert denied.status_code == 400
+    assert "access-control-allow-origin" not in denied.headers
+
+
+def test_cors_middleware_skipped_without_origins(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = make_client(monkeypatch, "")
+    response = client.get("/", headers={"Origin": "http://a.com"})
+    assert "access-control-allow-origin" not in response.headers
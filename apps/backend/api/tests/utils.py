@@ -0,0 +1,17 @@
+from typing import Any
+
+from app.core.config import Settings
+
+
+def make_settings(**overrides: Any) -> Settings:
+    """Создаёт настройки без чтения .env, с минимальным набором обязательных полей."""
+    values: dict[str, Any] = {
+        "PROJECT_NAME": "test",
+        "POSTGRES_SERVER": "localhost",
+        "POSTGRES_USER": "user",
+        "POSTGRES_PASSWORD": "s3cure-pass",
+        "FIRST_SUPERUSER": "admin@example.com",
+        "FIRST_SUPERUSER_PASSWORD": "s3cure-pass",
+    }
+    values.update(overrides)
+    return Settings(_env_file=None, **values)  # type: ignore[call-arg]